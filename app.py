@@ -1,11 +1,12 @@
 import streamlit as st
-import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-import time
 import os
+from collections import namedtuple
 from datetime import datetime
 
+import kernels
+
 # Page config
 st.set_page_config(page_title="Cloud Task Scheduling", layout="wide")
 
@@ -28,145 +29,128 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-class Processor:
-    def __init__(self, processor_id, processing_power=1.0):
-        self.id = processor_id
-        self.processing_power = processing_power
-        self.current_time = 0
-        self.assigned_tasks = []  # Store task objects directly
+@st.cache_data
+def generate_tasks(num_tasks):
+    """Generate the seeded task workload, shared by every algorithm run"""
+    np.random.seed(42)
     
-    def assign_task(self, task, arrival_time):
-        start_time = max(self.current_time, arrival_time)
-        processing_time = task.execution_time / self.processing_power
-        finish_time = start_time + processing_time
-        
-        # Store the task object and its calculated times
-        task_info = {
-            'task': task,
-            'start_time': start_time,
-            'finish_time': finish_time,
-            'execution_time': task.execution_time  # Store execution time here
-        }
-        self.assigned_tasks.append(task_info)
-        self.current_time = finish_time
-        return finish_time
+    # Generate arrival times
+    arrival_times = np.cumsum(np.random.exponential(50, num_tasks))
+    
+    # Generate execution times
+    execution_times = np.random.exponential(100, num_tasks) + 10
+    
+    return arrival_times, execution_times
 
 class DataCenter:
-    def __init__(self, num_processors=4):
-        self.processors = [Processor(i) for i in range(num_processors)]
+    def __init__(self, num_processors=4, num_runs=1):
+        self.num_processors = num_processors
+        self.num_runs = num_runs
+        self.processing_power = np.ones(num_processors)
+        # Scheduling state allocated once, one row per run so every
+        # algorithm's schedule is kept side by side
+        self.proc_busy = np.zeros((num_runs, num_processors))  # Total execution time assigned
+        # Per-task schedule, empty until TaskScheduler.load_tasks sizes it
+        self.start_times = np.empty((num_runs, 0))
+        self.finish_times = np.empty((num_runs, 0))
+        self.task_processor = np.empty((num_runs, 0), dtype=np.int64)
     
-    def reset_processors(self):
-        for processor in self.processors:
-            processor.current_time = 0
-            processor.assigned_tasks = []
+    def allocate_schedule(self, num_tasks):
+        """Size the per-task schedule arrays, reusing them if already that size"""
+        if self.finish_times.shape[1] == num_tasks:
+            return
+        self.start_times = np.empty((self.num_runs, num_tasks))
+        self.finish_times = np.empty((self.num_runs, num_tasks))
+        self.task_processor = np.empty((self.num_runs, num_tasks), dtype=np.int64)
 
-class Task:
-    def __init__(self, task_id, arrival_time, execution_time):
-        self.id = task_id
-        self.arrival_time = arrival_time
-        self.execution_time = execution_time
+# Task i arrives at arrival[i] and needs execution[i] seconds of work
+Tasks = namedtuple('Tasks', ['arrival', 'execution'])
 
 class TaskScheduler:
-    def __init__(self, datacenter):
+    def __init__(self, datacenter, run=0):
         self.datacenter = datacenter
-        self.tasks = []
+        self.run = run  # Row of the datacenter state this scheduler writes to
+        self.tasks = Tasks(np.empty(0), np.empty(0))
     
     def load_tasks(self, num_tasks):
-        self.tasks = []
-        np.random.seed(42)
-        
-        # Generate arrival times
-        arrival_times = np.cumsum(np.random.exponential(50, num_tasks))
-        arrival_times = np.maximum(arrival_times, 0)  # Ensure non-negative
-        
-        # Generate execution times
-        execution_times = np.random.exponential(100, num_tasks) + 10
-        
-        for i in range(num_tasks):
-            self.tasks.append(Task(i, arrival_times[i], execution_times[i]))
+        self.tasks = Tasks(*generate_tasks(num_tasks))
+        self.datacenter.allocate_schedule(num_tasks)
+    
+    def _run(self, kernel):
+        datacenter = self.datacenter
+        if datacenter.finish_times.shape[1] != len(self.tasks.arrival):
+            raise ValueError(f"DataCenter has room for {datacenter.finish_times.shape[1]} tasks, "
+                             f"got {len(self.tasks.arrival)}")
+        kernel(
+            self.tasks.arrival, self.tasks.execution, datacenter.processing_power,
+            datacenter.start_times[self.run], datacenter.finish_times[self.run],
+            datacenter.task_processor[self.run], datacenter.proc_busy[self.run]
+        )
+        return datacenter.finish_times[self.run]
     
     def fcfs_schedule(self):
         """First-Come-First-Served scheduling"""
-        self.datacenter.reset_processors()
-        finish_times = []
-        
-        # Sort by arrival time
-        sorted_tasks = sorted(self.tasks, key=lambda x: x.arrival_time)
-        
-        for task in sorted_tasks:
-            # Find processor with earliest available time
-            best_processor = min(self.datacenter.processors, key=lambda p: p.current_time)
-            finish_time = best_processor.assign_task(task, task.arrival_time)
-            finish_times.append(finish_time)
-        
-        return finish_times
+        return self._run(kernels.fcfs)
     
     def sjf_schedule(self):
         """Shortest Job First scheduling"""
-        self.datacenter.reset_processors()
-        finish_times = []
-        
-        # Sort by execution time (shortest first)
-        sorted_tasks = sorted(self.tasks, key=lambda x: x.execution_time)
-        
-        for task in sorted_tasks:
-            # Find processor with earliest available time
-            best_processor = min(self.datacenter.processors, key=lambda p: p.current_time)
-            finish_time = best_processor.assign_task(task, task.arrival_time)
-            finish_times.append(finish_time)
-        
-        return finish_times
+        return self._run(kernels.sjf)
     
     def eft_schedule(self):
         """Earliest Finish Time scheduling"""
-        self.datacenter.reset_processors()
-        finish_times = []
-        
-        for task in self.tasks:
-            # Calculate possible finish times on all processors
-            possible_finish_times = []
-            for processor in self.datacenter.processors:
-                start_time = max(processor.current_time, task.arrival_time)
-                processing_time = task.execution_time / processor.processing_power
-                finish_time = start_time + processing_time
-                possible_finish_times.append((finish_time, processor))
-            
-            # Choose processor with earliest finish time
-            best_finish_time, best_processor = min(possible_finish_times, key=lambda x: x[0])
-            actual_finish_time = best_processor.assign_task(task, task.arrival_time)
-            finish_times.append(actual_finish_time)
-        
-        return finish_times
+        return self._run(kernels.eft)
+    
+    def schedule(self, algorithm):
+        """Run the scheduling algorithm with the given name"""
+        if algorithm == "FCFS":
+            return self.fcfs_schedule()
+        elif algorithm == "SJF":
+            return self.sjf_schedule()
+        elif algorithm == "EFT":
+            return self.eft_schedule()
+        raise ValueError(f"Unknown algorithm: {algorithm}")
 
-def calculate_metrics(datacenter, finish_times, tasks):
+def calculate_metrics(datacenter, finish_times, tasks, run=0):
     """Calculate performance metrics"""
-    if not finish_times:
+    if len(finish_times) == 0:
         return {
             'makespan': 0,
             'throughput': 0,
             'resource_utilization': 0
         }
     
-    makespan = max(finish_times)
-    throughput = len(tasks) / makespan if makespan > 0 else 0
+    makespan = finish_times.max()
+    throughput = len(tasks.arrival) / makespan if makespan > 0 else 0
     
-    # Calculate utilization for each processor
-    utilizations = []
-    for processor in datacenter.processors:
-        if makespan > 0:
-            # Sum execution times from stored task info
-            busy_time = sum(task_info['execution_time'] for task_info in processor.assigned_tasks)
-            utilization = (busy_time / makespan) * 100
-        else:
-            utilization = 0
-        utilizations.append(utilization)
+    # Calculate utilization for each processor from its running busy time
+    if makespan > 0:
+        utilizations = datacenter.proc_busy[run] / makespan * 100
+    else:
+        utilizations = np.zeros(datacenter.num_processors)
     
     return {
         'makespan': makespan,
         'throughput': throughput,
-        'resource_utilization': np.mean(utilizations)
+        'resource_utilization': utilizations.mean()
     }
 
+@st.cache_data(max_entries=16)
+def simulate(num_tasks, algorithms):
+    """Run the selected algorithms on one workload and collect their metrics"""
+    # One DataCenter holds the state of every run; each algorithm gets a row
+    datacenter = DataCenter(num_runs=len(algorithms))
+    results = {}
+    
+    # Run one after another: at these task counts a thread pool costs more
+    # than the kernels themselves
+    for run, algo in enumerate(algorithms):
+        scheduler = TaskScheduler(datacenter, run)
+        scheduler.load_tasks(num_tasks)
+        finish_times = scheduler.schedule(algo)
+        results[algo] = calculate_metrics(datacenter, finish_times, scheduler.tasks, run)
+    
+    return results
+
 def main():
     st.markdown('<h1 class="main-header">☁️ Cloud Task Scheduling Simulator</h1>', unsafe_allow_html=True)
     
@@ -218,42 +202,14 @@ def main():
             st.error("⚠️ Please select at least one algorithm!")
             return
         
-        # Progress tracking
-        progress_bar = st.progress(0)
+        # Status tracking
         status_text = st.empty()
         
-        results = {}
-        
-        for i, algo in enumerate(algorithms):
-            status_text.text(f"🔄 Running {algo} algorithm...")
-            progress_bar.progress((i + 1) / len(algorithms))
-            
-            try:
-                datacenter = DataCenter()
-                scheduler = TaskScheduler(datacenter)
-                scheduler.load_tasks(num_tasks)
-                
-                if algo == "FCFS":
-                    finish_times = scheduler.fcfs_schedule()
-                elif algo == "SJF":
-                    finish_times = scheduler.sjf_schedule()
-                elif algo == "EFT":
-                    finish_times = scheduler.eft_schedule()
-                
-                results[algo] = calculate_metrics(datacenter, finish_times, scheduler.tasks)
-                time.sleep(0.5)  # Small delay for better UX
-                
-            except Exception as e:
-                st.error(f"Error in {algo}: {str(e)}")
-                continue
-        
-        status_text.text("✅ Simulation completed!")
-        progress_bar.progress(100)
-        time.sleep(0.5)
+        status_text.text(f"🔄 Running {', '.join(algorithms)}...")
+        results = simulate(num_tasks, tuple(algorithms))
         
-        # Clear progress indicators
+        # Clear status indicator
         status_text.empty()
-        progress_bar.empty()
         
         if results:
             # Display results
@@ -274,36 +230,6 @@ def main():
                         st.metric("Utilization", f"{results[algo]['resource_utilization']:.2f}%")
                         st.markdown('</div>', unsafe_allow_html=True)
             
-            # Visualization
-            st.subheader("📊 Performance Comparison")
-            
-            if len(results) > 0:
-                fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(15, 4))
-                
-                algorithms_list = list(results.keys())
-                makespans = [results[algo]['makespan'] for algo in algorithms_list]
-                throughputs = [results[algo]['throughput'] for algo in algorithms_list]
-                utilizations = [results[algo]['resource_utilization'] for algo in algorithms_list]
-                
-                colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
-                
-                ax1.bar(algorithms_list, makespans, color=colors[:len(algorithms_list)], alpha=0.8)
-                ax1.set_title('Makespan Comparison')
-                ax1.set_ylabel('Seconds')
-                
-                ax2.bar(algorithms_list, throughputs, color=colors[:len(algorithms_list)], alpha=0.8)
-                ax2.set_title('Throughput Comparison')
-                ax2.set_ylabel('Tasks/Second')
-                
-                ax3.bar(algorithms_list, utilizations, color=colors[:len(algorithms_list)], alpha=0.8)
-                ax3.set_title('Utilization Comparison')
-                ax3.set_ylabel('Percentage (%)')
-                
-                plt.tight_layout()
-                st.pyplot(fig)
-            
-            # Download results
-            st.subheader("💾 Export Results")
             results_df = pd.DataFrame([
                 {
                     'Algorithm': algo,
@@ -314,6 +240,27 @@ def main():
                 for algo, metrics in results.items()
             ])
             
+            # Visualization
+            st.subheader("📊 Performance Comparison")
+            
+            chart_df = results_df.set_index('Algorithm')
+            chart_cols = st.columns(3)
+            
+            with chart_cols[0]:
+                st.markdown("**Makespan Comparison**")
+                st.bar_chart(chart_df[['Makespan (seconds)']])
+            
+            with chart_cols[1]:
+                st.markdown("**Throughput Comparison**")
+                st.bar_chart(chart_df[['Throughput (tasks/second)']])
+            
+            with chart_cols[2]:
+                st.markdown("**Utilization Comparison**")
+                st.bar_chart(chart_df[['Utilization (%)']])
+            
+            # Download results
+            st.subheader("💾 Export Results")
+            
             st.dataframe(results_df, use_container_width=True)
             
             csv = results_df.to_csv(index=False)
@@ -0,0 +1,74 @@
+"""Numba scheduling kernels, compiled eagerly at import and cached on disk"""
+import heapq
+
+import numpy as np
+from numba import njit
+
+# Kernels write into caller-allocated (start_times, finish_times,
+# task_processor, proc_busy) arrays so one allocation serves every run
+_OUTPUTS = 'f8[:], f8[:], i8[:], f8[:]'
+_SCHEDULE_SIGNATURE = 'void(f8[:], f8[:], f8[:], ' + _OUTPUTS + ')'
+_LIST_SCHEDULE_SIGNATURE = 'void(i8[:], f8[:], f8[:], f8[:], ' + _OUTPUTS + ')'
+
+@njit(_LIST_SCHEDULE_SIGNATURE, cache=True, fastmath=True, nogil=True)
+def _list_schedule(order, arrival_times, execution_times, processing_power,
+                   start_times, finish_times, task_processor, proc_busy):
+    """Assign tasks in the given order to the earliest available processor"""
+    num_processors = processing_power.size
+    proc_busy[:] = 0  # Total execution time assigned
+    
+    # Min-heap of (time processor becomes free, processor id); equal times
+    # pop the lowest id first, same as an argmin over the processors
+    proc_heap = [(0.0, p) for p in range(num_processors)]
+    heapq.heapify(proc_heap)
+    
+    for i in order:
+        proc_time, p = proc_heap[0]
+        start_time = max(proc_time, arrival_times[i])
+        finish_time = start_time + execution_times[i] / processing_power[p]
+        heapq.heapreplace(proc_heap, (finish_time, p))
+        proc_busy[p] += execution_times[i]
+        start_times[i] = start_time
+        finish_times[i] = finish_time
+        task_processor[i] = p
+
+@njit(_SCHEDULE_SIGNATURE, cache=True, fastmath=True, nogil=True)
+def fcfs(arrival_times, execution_times, processing_power,
+         start_times, finish_times, task_processor, proc_busy):
+    """First-Come-First-Served scheduling"""
+    # Sort by arrival time
+    order = np.argsort(arrival_times, kind="mergesort")
+    _list_schedule(order, arrival_times, execution_times, processing_power,
+                   start_times, finish_times, task_processor, proc_busy)
+
+@njit(_SCHEDULE_SIGNATURE, cache=True, fastmath=True, nogil=True)
+def sjf(arrival_times, execution_times, processing_power,
+        start_times, finish_times, task_processor, proc_busy):
+    """Shortest Job First scheduling"""
+    # Sort by execution time (shortest first)
+    order = np.argsort(execution_times, kind="mergesort")
+    _list_schedule(order, arrival_times, execution_times, processing_power,
+                   start_times, finish_times, task_processor, proc_busy)
+
+@njit(_SCHEDULE_SIGNATURE, cache=True, fastmath=True, nogil=True)
+def eft(arrival_times, execution_times, processing_power,
+        start_times, finish_times, task_processor, proc_busy):
+    """Earliest Finish Time scheduling"""
+    num_processors = processing_power.size
+    proc_time = np.zeros(num_processors)
+    proc_busy[:] = 0
+    finish_candidates = np.empty(num_processors)  # Reused for every task
+    
+    for i in range(arrival_times.size):
+        # Possible finish times on all processors
+        for p in range(num_processors):
+            start_time = max(proc_time[p], arrival_times[i])
+            finish_candidates[p] = start_time + execution_times[i] / processing_power[p]
+        
+        # Choose processor with earliest finish time
+        best_processor = finish_candidates.argmin()
+        proc_busy[best_processor] += execution_times[i]
+        start_times[i] = max(proc_time[best_processor], arrival_times[i])
+        finish_times[i] = finish_candidates[best_processor]
+        task_processor[i] = best_processor
+        proc_time[best_processor] = finish_candidates[best_processor]